@@ -4,6 +4,7 @@ Updated: Removed 30d tracking and control group, added filter tracking
 Now tracks: Inst %, Relative Fresh, Regime, Days to Earnings
 """
 import gspread
+from gspread.utils import rowcol_to_a1
 from oauth2client.service_account import ServiceAccountCredentials
 import pandas as pd
 from datetime import datetime, timedelta
@@ -16,6 +17,12 @@ SHEET_NAME = "SupabotV3"
 TAB_NAME = "Sheet1"
 SERVICE_ACCOUNT_FILE = "service_account.json"
 
+# Strips sheet number formatting ("+4.20%", "$12.34") in one pass
+NUMBER_FORMAT_CHARS = str.maketrans('', '', '%+$ ')
+
+# Ranges per batch_update request
+BATCH_CHUNK = 500
+
 def connect_to_sheet():
     """Connect to Google Sheets."""
     scope = ['https://spreadsheets.google.com/feeds',
@@ -27,6 +34,22 @@ def connect_to_sheet():
     sheet = client.open(SHEET_NAME).worksheet(TAB_NAME)
     return sheet
 
+def batch_write(sheet, batch_updates):
+    """Write queued {'range', 'values'} updates in as few API calls as possible."""
+    for start in range(0, len(batch_updates), BATCH_CHUNK):
+        sheet.batch_update(batch_updates[start:start + BATCH_CHUNK], value_input_option='RAW')
+
+def column_letter(col):
+    """A1 column letter(s) for a 0-based column index (works past Z)."""
+    return rowcol_to_a1(1, col + 1)[:-1]
+
+def header_columns(headers):
+    """Map each header name to its (first) column index in one pass."""
+    columns = {}
+    for i, name in enumerate(headers):
+        columns.setdefault(name, i)
+    return columns
+
 def get_latest_csv():
     """Get most recent V3 scan CSV."""
     csv_files = glob.glob("outputs/supabot_v3_scan_*.csv")
@@ -38,13 +61,14 @@ def get_latest_csv():
     print(f"📄 Found: {latest}")
     return latest
 
-def calculate_batch_summary(sheet, batch_date: str):
+def calculate_batch_summary(sheet, batch_date: str, all_values=None):
     """Calculate summary stats for a completed batch."""
     
     print(f"\n📊 Calculating summary for {batch_date} batch...")
     
-    # Get all data
-    all_values = sheet.get_all_values()
+    # Get all data (unless the caller already has it)
+    if all_values is None:
+        all_values = sheet.get_all_values()
     
     # Find header row
     header_row = 0
@@ -56,30 +80,23 @@ def calculate_batch_summary(sheet, batch_date: str):
     headers = all_values[header_row]
     
     # Find column indices
-    date_col = headers.index("Date")
-    return_col = headers.index("7d %")  # Column V (index 21)
+    columns = header_columns(headers)
+    date_col = columns["Date"]
+    return_col = columns["7d %"]  # Column V (index 21)
+    summary_first = column_letter(columns["7d Win Rate %"])  # Column W
+    summary_last = column_letter(columns["S&P 7d %"])        # Column Y
     
     # Find rows for this batch date
-    batch_rows = []
-    for i in range(header_row + 1, len(all_values)):
-        row = all_values[i]
-        if row[date_col] == batch_date:
-            batch_rows.append((i, row))
+    rows = pd.DataFrame(all_values[header_row + 1:], columns=range(len(headers)))
+    batch_rows = rows[rows[date_col] == batch_date]
     
-    if not batch_rows:
+    if batch_rows.empty:
         print(f"  ⚠️  No rows found for {batch_date}")
         return
     
-    # Check if all exits are filled
-    returns = []
-    
-    for i, row in batch_rows:
-        if row[return_col]:
-            try:
-                ret = float(row[return_col].replace('%', '').replace('+', ''))
-                returns.append(ret)
-            except:
-                pass
+    # Check if all exits are filled (blank/unparseable returns drop out)
+    returns = pd.to_numeric(batch_rows[return_col].str.translate(NUMBER_FORMAT_CHARS),
+                            errors='coerce').dropna()
     
     # If not all exits filled, skip
     total_picks = len(batch_rows)
@@ -88,8 +105,8 @@ def calculate_batch_summary(sheet, batch_date: str):
         return
     
     # Calculate stats
-    win_rate = (sum(1 for r in returns if r > 0) / len(returns)) * 100
-    avg_return = sum(returns) / len(returns)
+    win_rate = (returns > 0).mean() * 100
+    avg_return = returns.mean()
     
     # Calculate S&P 7d %
     try:
@@ -115,123 +132,17 @@ def calculate_batch_summary(sheet, batch_date: str):
         spy_return = 0
     
     # Write summary to last pick's row (columns W, X, Y)
-    last_row_num = batch_rows[-1][0] + 1
+    last_row_num = header_row + 1 + batch_rows.index[-1] + 1
     
     summary_values = [
         [f'{win_rate:.1f}%', f'{avg_return:+.2f}%', f'{spy_return:+.2f}%']
     ]
     
-    sheet.update(values=summary_values, range_name=f'W{last_row_num}:Y{last_row_num}')
+    sheet.update(values=summary_values, range_name=f'{summary_first}{last_row_num}:{summary_last}{last_row_num}')
     
     print(f"  ✅ Summary added to row {last_row_num}:")
     print(f"     Win Rate: {win_rate:.1f}% | Avg Return: {avg_return:+.2f}% | S&P: {spy_return:+.2f}%")
 
-def fill_sheet(sheet, csv_path):
-    """Fill Google Sheet from CSV."""
-    
-    # Read CSV
-    df = pd.read_csv(csv_path)
-    
-    # Only V4 picks (no control group)
-    v4_picks = df[df['group'].isin(['V3', 'V4'])].copy()
-    
-    print(f"\n✍️  Writing {len(v4_picks)} V4 picks...")
-    
-    # Find next empty row (2 rows down from last data)
-    all_values = sheet.get_all_values()
-    last_data_row = len(all_values)
-    
-    for i in range(len(all_values) - 1, -1, -1):
-        if any(cell.strip() for cell in all_values[i]):
-            last_data_row = i + 1
-            break
-    
-    next_row = last_data_row + 2
-    
-    today = datetime.now().strftime('%Y-%m-%d')
-    
-    print(f"📍 Starting at row {next_row}")
-    
-    # Updated headers (25 columns, no 30d, no control)
-    headers = [
-        "Date", "Ticker", "V4Score", "Entry Price", "Buzz", "Twitter", "Reddit",
-        "Market Cap", "Short Interest", "Past week 7d%", "Sector",
-        "BB", "ATR", "Vol Trend", "RSI", "52w from high",
-        "Inst %", "Relative Fresh", "Regime", "Days to Earnings",
-        "Exit Price (7d)", "7d %",
-        "7d Win Rate %", "7d Average Return %", "S&P 7d %"
-    ]
-    
-    # Write headers
-    sheet.update(values=[headers], range_name=f'A{next_row}:Y{next_row}')
-    
-    # Format headers
-    sheet.format(f'A{next_row}:Y{next_row}', {
-        "textFormat": {
-            "bold": True,
-            "fontFamily": "Cambria",
-            "fontSize": 12
-        }
-    })
-    
-    print(f"✅ Headers added at row {next_row}")
-    
-    data_start_row = next_row + 1
-    
-    # Format data rows
-    sheet.format(f'A{data_start_row}:Y{data_start_row + len(v4_picks)}', {
-        "textFormat": {
-            "fontFamily": "Cambria",
-            "fontSize": 12
-        }
-    })
-    
-    # Write each pick
-    for i in range(len(v4_picks)):
-        pick = v4_picks.iloc[i]
-        
-        # Extract market cap size only
-        cap_text = pick.get('cap_size', 'N/A')
-        if '(' in cap_text:
-            cap_size = cap_text.split('(')[0].strip().upper()
-        else:
-            cap_size = cap_text.upper()
-        
-        row_data = [
-            today,                                      # A: Date
-            pick['ticker'],                             # B: Ticker
-            int(pick.get('v4_score', 0)),               # C: V4Score
-            f"${pick['price']:.2f}",                    # D: Entry Price
-            pick.get('buzz_level', 'N/A').upper(),      # E: Buzz
-            int(pick.get('twitter_mentions', 0)),       # F: Twitter
-            int(pick.get('reddit_mentions', 0)),        # G: Reddit
-            cap_size,                                    # H: Market Cap
-            f"{pick.get('short_percent', 0):.1f}%",     # I: Short Interest
-            f"{pick.get('change_7d', 0):+.1f}%",        # J: Past week 7d% (Absolute Fresh)
-            pick.get('sector', 'N/A'),                  # K: Sector
-            f"{pick.get('bb_position', 0):.2f}",        # L: BB
-            f"{pick.get('atr_pct', 0):.1f}%",           # M: ATR
-            f"{pick.get('volume_trend', 0):.2f}",       # N: Vol Trend
-            int(pick.get('rsi', 0)),                    # O: RSI
-            f"{pick.get('dist_52w_high', 0):+.1f}%",    # P: 52w from high
-            f"{pick.get('inst_ownership', 0):.1f}%",    # Q: Inst %
-            f"{pick.get('relative_fresh', 0):+.1f}%",   # R: Relative Fresh
-            pick.get('regime', 'N/A'),                  # S: Regime
-            str(pick.get('days_to_earnings', 'N/A')),   # T: Days to Earnings
-            "",                                          # U: Exit Price (7d)
-            "",                                          # V: 7d %
-            "",                                          # W: 7d Win Rate %
-            "",                                          # X: 7d Average Return %
-            "",                                          # Y: S&P 7d %
-        ]
-        
-        # Write row
-        sheet.update(values=[row_data], range_name=f'A{data_start_row + i}:Y{data_start_row + i}')
-        
-        print(f"  ✅ Row {data_start_row + i}: {pick['ticker']}")
-    
-    print(f"\n🎉 Done! Added {len(v4_picks)} picks")
-
 def update_exit_prices(sheet):
     """Auto-fill exit prices for 7-day-old trades."""
     
@@ -249,80 +160,86 @@ def update_exit_prices(sheet):
     headers = all_values[header_row]
     
     # Find column indices
-    date_col = headers.index("Date")
-    ticker_col = headers.index("Ticker")
-    entry_price_col = headers.index("Entry Price")
-    exit_price_col = headers.index("Exit Price (7d)")  # Column U (index 20)
-    return_col = headers.index("7d %")                  # Column V (index 21)
+    columns = header_columns(headers)
+    date_col = columns["Date"]
+    ticker_col = columns["Ticker"]
+    entry_price_col = columns["Entry Price"]
+    exit_price_col = columns["Exit Price (7d)"]  # Column U (index 20)
+    return_col = columns["7d %"]                  # Column V (index 21)
+    exit_price_letter = column_letter(exit_price_col)
+    return_letter = column_letter(return_col)
     
     today = datetime.now().date()
     updates = []
+    batch_updates = []
+    
+    # Parse every entry date at once (header/blank rows become NaT)
+    rows = pd.DataFrame(all_values[header_row + 1:], columns=range(len(headers)))
+    entry_dates = pd.to_datetime(rows[date_col], format='%Y-%m-%d', errors='coerce')
+    
+    # Only rows past their 7d exit date with a ticker and no exit filled yet
+    due = ((entry_dates < pd.Timestamp(today - timedelta(days=7))) &
+           (rows[ticker_col] != '') & (rows[exit_price_col] == ''))
     
-    # Check each data row
-    for i in range(header_row + 1, len(all_values)):
+    # Check each due row
+    for idx in rows.index[due]:
+        i = header_row + 1 + idx
         row = all_values[i]
-        
-        # Parse entry date
-        try:
-            entry_date = datetime.strptime(row[date_col], '%Y-%m-%d').date()
-        except:
-            continue
-        
-        # Calculate target exit date
+        entry_date = entry_dates[idx].date()
         target_exit_date = entry_date + timedelta(days=7)
         
-        # Only process if we're past exit date
-        if today <= target_exit_date:
-            continue
+        ticker = row[ticker_col]
+        entry_price_str = row[entry_price_col].translate(NUMBER_FORMAT_CHARS)
         
-        # Only process if exit not already filled
-        if row[ticker_col] and not row[exit_price_col]:
-            ticker = row[ticker_col]
-            entry_price_str = row[entry_price_col].replace('$', '')
+        try:
+            entry_price = float(entry_price_str)
             
-            try:
-                entry_price = float(entry_price_str)
-                
-                # Fetch historical data
-                stock = yf.Ticker(ticker)
-                start_date = entry_date
-                end_date = today + timedelta(days=1)
-                
-                hist = stock.history(start=start_date.strftime('%Y-%m-%d'), 
-                                    end=end_date.strftime('%Y-%m-%d'))
+            # Fetch historical data
+            stock = yf.Ticker(ticker)
+            start_date = entry_date
+            end_date = today + timedelta(days=1)
+            
+            hist = stock.history(start=start_date.strftime('%Y-%m-%d'), 
+                                end=end_date.strftime('%Y-%m-%d'))
+            
+            if len(hist) > 0:
+                # Find close on or after target exit date
+                exit_prices = hist[hist.index.date >= target_exit_date]
                 
-                if len(hist) > 0:
-                    # Find close on or after target exit date
-                    exit_prices = hist[hist.index.date >= target_exit_date]
+                if len(exit_prices) > 0:
+                    exit_price = float(exit_prices['Close'].iloc[0])
+                    actual_exit_date = exit_prices.index[0].strftime('%Y-%m-%d')
+                    return_pct = ((exit_price - entry_price) / entry_price) * 100
                     
-                    if len(exit_prices) > 0:
-                        exit_price = float(exit_prices['Close'].iloc[0])
-                        actual_exit_date = exit_prices.index[0].strftime('%Y-%m-%d')
-                        return_pct = ((exit_price - entry_price) / entry_price) * 100
-                        
-                        row_num = i + 1
-                        
-                        # Update Exit Price (column U)
-                        sheet.update(values=[[f'${exit_price:.2f}']], range_name=f'U{row_num}')
-                        
-                        # Update 7d % (column V)
-                        sheet.update(values=[[f'{return_pct:+.2f}%']], range_name=f'V{row_num}')
-                        
-                        days_held = (datetime.strptime(actual_exit_date, '%Y-%m-%d').date() - entry_date).days
-                        
-                        updates.append({
-                            'ticker': ticker,
-                            'entry_date': str(entry_date),
-                            'exit_date': actual_exit_date,
-                            'days_held': days_held,
-                            'return': return_pct
-                        })
-                        
-                        print(f"  ✅ {ticker}: {entry_date} → {actual_exit_date} ({days_held}d) | "
-                              f"${entry_price:.2f} → ${exit_price:.2f} ({return_pct:+.2f}%)")
-            
-            except Exception as e:
-                print(f"  ⚠️  {ticker}: Error - {e}")
+                    row_num = i + 1
+                    
+                    # Queue Exit Price (column U) and 7d % (column V)
+                    batch_updates.append({'range': f'{exit_price_letter}{row_num}',
+                                          'values': [[f'${exit_price:.2f}']]})
+                    batch_updates.append({'range': f'{return_letter}{row_num}',
+                                          'values': [[f'{return_pct:+.2f}%']]})
+                    
+                    # Mirror the write locally so batch summaries needn't re-read the sheet
+                    row[exit_price_col] = f'${exit_price:.2f}'
+                    row[return_col] = f'{return_pct:+.2f}%'
+                    
+                    days_held = (datetime.strptime(actual_exit_date, '%Y-%m-%d').date() - entry_date).days
+                    
+                    updates.append({
+                        'ticker': ticker,
+                        'entry_date': str(entry_date),
+                        'exit_date': actual_exit_date,
+                        'days_held': days_held,
+                        'return': return_pct
+                    })
+                    
+                    print(f"  ✅ {ticker}: {entry_date} → {actual_exit_date} ({days_held}d) | "
+                          f"${entry_price:.2f} → ${exit_price:.2f} ({return_pct:+.2f}%)")
+        
+        except Exception as e:
+            print(f"  ⚠️  {ticker}: Error - {e}")
+    
+    batch_write(sheet, batch_updates)
     
     # Calculate batch summaries
     if updates:
@@ -337,7 +254,7 @@ def update_exit_prices(sheet):
         
         # Calculate summary for each completed batch
         for batch_date in unique_dates:
-            calculate_batch_summary(sheet, batch_date)
+            calculate_batch_summary(sheet, batch_date, all_values)
         
         print(f"{'='*60}\n")
     else:
@@ -404,16 +321,13 @@ def fill_sheet(sheet, csv_path):
         }
     })
     
-    # Write each pick
-    for i in range(len(v4_picks)):
-        pick = v4_picks.iloc[i]
-        
-        # Extract market cap size
-        cap_text = pick.get('cap_size', 'N/A')
-        if '(' in cap_text:
-            cap_size = cap_text.split('(')[0].strip().upper()
-        else:
-            cap_size = cap_text.upper()
+    # Market cap size only ("Large ($10-50B)" -> "LARGE"), once for the whole column
+    v4_picks['cap_label'] = v4_picks['cap_size'].str.split('(', n=1).str[0].str.strip().str.upper()
+    
+    # Queue each pick, then write them together
+    batch_updates = []
+    row_lines = []
+    for i, pick in enumerate(v4_picks.to_dict('records')):
         
         row_data = [
             today,                                      # A: Date
@@ -423,7 +337,7 @@ def fill_sheet(sheet, csv_path):
             pick.get('buzz_level', 'N/A').upper(),      # E: Buzz
             int(pick.get('twitter_mentions', 0)),       # F: Twitter
             int(pick.get('reddit_mentions', 0)),        # G: Reddit
-            cap_size,                                    # H: Market Cap
+            pick['cap_label'],                          # H: Market Cap
             f"{pick.get('short_percent', 0):.1f}%",     # I: Short Interest
             f"{pick.get('change_7d', 0):+.1f}%",        # J: Past week 7d%
             pick.get('sector', 'N/A'),                  # K: Sector
@@ -443,10 +357,12 @@ def fill_sheet(sheet, csv_path):
             "",                                          # Y: S&P 7d %
         ]
         
-        # Write row
-        sheet.update(values=[row_data], range_name=f'A{data_start_row + i}:Y{data_start_row + i}')
-        
-        print(f"  ✅ Row {data_start_row + i}: {pick['ticker']}")
+        batch_updates.append({'range': f'A{data_start_row + i}:Y{data_start_row + i}', 'values': [row_data]})
+        row_lines.append(f"  ✅ Row {data_start_row + i}: {pick['ticker']}")
+    
+    batch_write(sheet, batch_updates)
+    if row_lines:
+        print("\n".join(row_lines))
     
     print(f"\n🎉 Done! Added {len(v4_picks)} picks starting at row {data_start_row}")
 
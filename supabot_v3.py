@@ -1,11 +1,18 @@
 import os
 import sys
+import csv
+import heapq
 import random
 import json
 try:
     import alpaca_trade_api as tradeapi
 except:
     tradeapi = None
+try:
+    import orjson
+except:
+    orjson = None
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple
 import pandas as pd
@@ -15,6 +22,8 @@ import numpy as np
 import yfinance as yf
 import praw
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from finvizfinance.screener.overview import Overview
 import warnings
 warnings.filterwarnings('ignore', category=FutureWarning)
@@ -30,36 +39,82 @@ ALPACA_API_KEY = os.getenv("ALPACA_API_KEY")
 ALPACA_SECRET_KEY = os.getenv("ALPACA_SECRET_KEY")
 ALPACA_BASE_URL = "https://paper-api.alpaca.markets"
 POSITIONS_FILE = "alpaca_positions.json"
+RECENT_PICKS_FILE = "recent_picks.json"
+OUTPUTS_DIR = "outputs"
+os.makedirs(OUTPUTS_DIR, exist_ok=True)
 
 # Settings
 FRESH_MIN = -5.0
 FRESH_MAX = 5.0
 MIN_MARKET_CAP = 500_000_000
+SMALL_CAP_MAX = 2_000_000_000  # <$2B: 'Small' cap label and hard skip
 MIN_PRICE = 5.0
 MIN_VOLUME_USD = 2_000_000
 MAX_SHORT_PERCENT = 20.0
 MIN_TWITTER_BUZZ = 15
 MIN_REDDIT_BUZZ = 5
 SCAN_LIMIT = 400
+REDDIT_SUBREDDITS = ['wallstreetbets', 'stocks', 'options']
+TWITTER_MAX_WORKERS = 10
 
 BANNED_SECTORS = ['Energy', 'Consumer Cyclical', 'Utilities', 'Financial Services']
 
+# Shared HTTP session - keeps TLS connections alive across API calls
+# (pool sized above TWITTER_MAX_WORKERS so concurrent checks don't block)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
+
+_INFO_CACHE = {}
+
+
+def get_ticker_info(ticker: str) -> Dict:
+    """
+    Fetch yfinance .info once per ticker and reuse it for the rest of the run.
+    get_universe() already pulls it for the sector filter, so quality, short
+    interest and earnings checks all read from the same payload.
+    """
+    if ticker not in _INFO_CACHE:
+        _INFO_CACHE[ticker] = yf.Ticker(ticker).info
+    return _INFO_CACHE[ticker]
+
+
+def fetch_ohlcv(ticker: str, period: str = "1y") -> Dict[str, np.ndarray]:
+    """
+    Daily OHLCV from yf.Ticker(ticker).history(period=period) as numpy arrays
+    ('open', 'high', 'low', 'close', 'volume'), oldest first. yfinance keeps
+    handling the session, rate limits and bar repair (e.g. the duplicate live
+    bar intraday); this only unpacks the one download per ticker.
+    """
+    hist = yf.Ticker(ticker).history(period=period)
+    return {key.lower(): hist[key].to_numpy(dtype=float) for key in ('Open', 'High', 'Low', 'Close', 'Volume')}
+
+
 # ============ METRIC CALCULATORS ============
+# Each calculator takes the fetch_ohlcv() arrays and only reads the window it
+# needs, so one 1y download per ticker feeds all of them.
 
-def calculate_bollinger_position(ticker: str) -> float:
+def calculate_bollinger_position(hist: Dict[str, np.ndarray]) -> float:
     """Calculate where price is within Bollinger Bands (0-1 scale)."""
     try:
-        hist = yf.Ticker(ticker).history(period="3mo")
-        if len(hist) < 20:
+        if len(hist['close']) < 20:
             return 0.5
         
-        close = hist['Close']
-        sma_20 = close.rolling(20).mean().iloc[-1]
-        std_20 = close.rolling(20).std().iloc[-1]
+        # Only the latest band is needed - skip the full rolling pass
+        tail = hist['close'][-20:]
+        # Flat closes: mean() rounding leaves std ~1e-15 instead of 0,
+        # which would land on 0.25/0.75 instead of mid-band
+        if np.ptp(tail) == 0:
+            return 0.5
+        sma_20 = tail.mean()
+        std_20 = tail.std(ddof=1)
         
         bb_upper = sma_20 + (2 * std_20)
         bb_lower = sma_20 - (2 * std_20)
-        current = close.iloc[-1]
+        current = tail[-1]
         
         if bb_upper == bb_lower:
             return 0.5
@@ -70,25 +125,25 @@ def calculate_bollinger_position(ticker: str) -> float:
         return 0.5
 
 
-def calculate_atr_normalized(ticker: str) -> float:
+def calculate_atr_normalized(hist: Dict[str, np.ndarray]) -> float:
     """Calculate ATR as % of price (volatility measure)."""
     try:
-        hist = yf.Ticker(ticker).history(period="2mo")
-        if len(hist) < 14:
+        if len(hist['close']) < 14:
             return 0.0
         
-        high = hist['High']
-        low = hist['Low']
-        close = hist['Close']
-        
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(14).mean().iloc[-1]
-        
-        current_price = close.iloc[-1]
+        high = hist['high']
+        low = hist['low']
+        close = hist['close']
+
+        prev_close = np.empty_like(close)
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
+
+        # fmax skips the NaN on the first bar (same as DataFrame.max)
+        tr = np.fmax.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+        atr = tr[-14:].mean()
+
+        current_price = close[-1]
         atr_pct = (atr / current_price * 100) if current_price > 0 else 0
         
         return round(float(atr_pct), 2)
@@ -96,16 +151,15 @@ def calculate_atr_normalized(ticker: str) -> float:
         return 0.0
 
 
-def calculate_volume_trend(ticker: str) -> float:
+def calculate_volume_trend(hist: Dict[str, np.ndarray]) -> float:
     """Calculate volume acceleration (recent vs baseline)."""
     try:
-        hist = yf.Ticker(ticker).history(period="1mo")
-        if len(hist) < 20:
+        if len(hist['volume']) < 20:
             return 1.0
         
-        volume = hist['Volume']
-        recent_5d = volume.tail(5).mean()
-        baseline_15d = volume.tail(20).head(15).mean()
+        volume = hist['volume']
+        recent_5d = volume[-5:].mean()
+        baseline_15d = volume[-20:-5].mean()
         
         trend = recent_5d / baseline_15d if baseline_15d > 0 else 1.0
         return round(float(trend), 2)
@@ -113,26 +167,24 @@ def calculate_volume_trend(ticker: str) -> float:
         return 1.0
 
 
-def get_rsi(ticker: str) -> float:
+def get_rsi(hist: Dict[str, np.ndarray]) -> float:
     """Get current RSI value."""
     try:
-        hist = yf.Ticker(ticker).history(period="2mo")
-        if len(hist) < 14:
+        if len(hist['close']) < 14:
             return 50.0
         
-        close = hist['Close']
-        delta = close.diff()
-        
-        gains = delta.clip(lower=0)
-        losses = -delta.clip(upper=0)
+        # Only the latest 14-bar window is needed
+        delta = np.diff(hist['close'])[-14:]
         
-        avg_gains = gains.rolling(14).mean()
-        avg_losses = losses.rolling(14).mean()
+        avg_gains = np.where(delta > 0, delta, 0.0).mean()
+        avg_losses = np.where(delta < 0, -delta, 0.0).mean()
         
-        rs = avg_gains / avg_losses
+        # No losses -> rs = inf -> RSI 100 (same as the pandas version)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = avg_gains / avg_losses
         rsi = 100 - (100 / (1 + rs))
         
-        return round(float(rsi.iloc[-1]), 1)
+        return round(float(rsi), 1)
     except:
         return 50.0
 
@@ -147,7 +199,7 @@ def check_earnings_proximity(ticker: str, entry_date: datetime) -> Dict:
     - earnings_sweet_spot: True if earnings 30-60 days away (BOOST SCORE)
     """
     try:
-        info = yf.Ticker(ticker).info
+        info = get_ticker_info(ticker)
         earnings_timestamp = info.get('earningsTimestamp')
         
         if not earnings_timestamp:
@@ -186,16 +238,15 @@ def check_earnings_proximity(ticker: str, entry_date: datetime) -> Dict:
         }
 
 
-def calculate_52w_positioning(ticker: str) -> Dict:
+def calculate_52w_positioning(hist: Dict[str, np.ndarray]) -> Dict:
     """Calculate distance to 52-week high/low."""
     try:
-        hist = yf.Ticker(ticker).history(period="1y")
-        if len(hist) < 200:
+        if len(hist['close']) < 200:
             return {'dist_52w_high': 0.0, 'dist_52w_low': 0.0}
         
-        high_52w = hist['High'].max()
-        low_52w = hist['Low'].min()
-        current = hist['Close'].iloc[-1]
+        high_52w = np.nanmax(hist['high'])
+        low_52w = np.nanmin(hist['low'])
+        current = hist['close'][-1]
         
         dist_high = ((current / high_52w) - 1) * 100
         dist_low = ((current / low_52w) - 1) * 100
@@ -210,56 +261,105 @@ def calculate_52w_positioning(ticker: str) -> Dict:
 
 # ============ SCORING FUNCTIONS ============
 
-def calculate_quality_score(pick: Dict) -> float:
+# V4 lookup tables. Buckets are np.searchsorted(..., side='right') edges, so
+# each edge is left-closed; nextafter() makes an edge right-closed instead.
+
+V4_FRESH_EDGES = np.array([-2.0, 0.0, 1.0, np.nextafter(2.0, np.inf), np.nextafter(3.0, np.inf), 4.0, np.nextafter(5.0, np.inf)])
+V4_FRESH_POINTS = np.array([
+    10,  # < -2%
+    20,  # -2% to 0%: 59.5% WR (25-17 on 42 trades)
+    40,  # 0-1%: 71.2% WR (47-19 on 66 trades)
+    50,  # 1-2%: 80.4% WR (41-10 on 51 trades)
+    10,  # 2-3%
+    5,   # 3-4% (exclusive): 38.1% WR (8-13 on 21 trades) - TOXIC!
+    45,  # 4-5%: 87.5% WR (14-2 on 16 trades)
+    10,  # > 5%
+])
+
+V4_SI_EDGES = np.array([0.0, 1.0, 2.0, 3.0, np.nextafter(7.0, np.inf), 10.0, 15.0])
+V4_SI_POINTS = np.array([
+    0,   # negative / missing
+    15,  # 0-1%: 78.9% WR (30-8 on 38 trades)
+    15,  # 1-2%: 61.1% WR
+    25,  # 2-3%: 60.7% WR
+    40,  # 3-7%: 71.9-73.3% WR
+    30,  # 7-10%: 72.0% WR
+    10,  # 10-15%: 51.7% WR
+    0,   # SI ≥15% gets 0
+])
+
+V4_CAP_POINTS = {
+    "Large ($10-50B)": 35,  # 77.1% WR (64-19 on 83 trades)
+    "Mid ($2-10B)": 25,     # 67.3% WR (70-34 on 104 trades)
+    "Mega (>$50B)": 15,     # 66.7% WR (8-4 on 12 trades)
+    "Small (<$2B)": 0,      # 46.2% WR (18-21) LOSES MONEY!
+}
+V4_INST_BOOST_CAPS = {"Large ($10-50B)", "Mid ($2-10B)"}
+
+V4_SECTOR_POINTS = {
+    'Basic Materials': 25,         # 81.5% WR (22-5 on 27 trades)
+    'Communication Services': 20,  # 76.0% WR (19-6 on 25 trades)
+    'Healthcare': 5,               # 65.0% WR (26-14)
+}
+
+_V3_CAP_POINTS = {}
+
+
+def get_v3_cap_points(cap_size: str) -> int:
+    """V3 market cap points (5-15), cached per cap label."""
+    if cap_size not in _V3_CAP_POINTS:
+        if 'Mid' in cap_size or 'Large' in cap_size:
+            _V3_CAP_POINTS[cap_size] = 15
+        elif 'Small' in cap_size:
+            _V3_CAP_POINTS[cap_size] = 10
+        else:
+            _V3_CAP_POINTS[cap_size] = 5
+    return _V3_CAP_POINTS[cap_size]
+
+
+def calculate_quality_score(pick: Dict) -> int:
+    """V3 score for a single pick - see calculate_quality_scores()."""
+    return int(calculate_quality_scores([pick])[0])
+
+
+def calculate_quality_scores(picks: List[Dict]) -> np.ndarray:
     """
     V3 scoring - FOR TRACKING ONLY (not used for selection).
-    Based on buzz, fresh, volume, cap.
+    Based on buzz, fresh, volume, cap. Scores every pick in one pass; this is
+    the only implementation of the V3 rules.
     """
-    score = 0
+    df = pd.DataFrame(picks)
+    
+    total_buzz = df['twitter_mentions'].to_numpy(dtype=float) + df['reddit_mentions'].to_numpy(dtype=float) * 2
+    fresh = df['change_7d'].to_numpy(dtype=float)
+    # fillna first: NaN (pick without the key) would cast to True
+    volume_spike = df['volume_spike'].fillna(False).to_numpy().astype(bool) if 'volume_spike' in df else np.zeros(len(df), dtype=bool)
+    cap_size = df['cap_size'].astype(str)
     
     # Buzz (10-40 points)
-    twitter = pick['twitter_mentions']
-    reddit = pick['reddit_mentions']
-    total_buzz = twitter + (reddit * 2)
-    
-    if total_buzz >= 50:
-        score += 40
-    elif total_buzz >= 30:
-        score += 30
-    elif total_buzz >= 20:
-        score += 20
-    else:
-        score += 10
+    score = np.select([total_buzz >= 50, total_buzz >= 30, total_buzz >= 20], [40, 30, 20], default=10)
     
     # Fresh position (10-30 points)
-    fresh = pick['change_7d']
-    if 0 <= fresh <= 2:
-        score += 30
-    elif -2 <= fresh < 0:
-        score += 25
-    elif 2 < fresh <= 5:
-        score += 20
-    else:
-        score += 10
+    score = score + np.select(
+        [(fresh >= 0) & (fresh <= 2), (fresh >= -2) & (fresh < 0), (fresh > 2) & (fresh <= 5)],
+        [30, 25, 20], default=10)
     
     # Volume spike (0-15 points)
-    if pick.get('volume_spike'):
-        score += 15
-    elif pick['volume_ratio'] > 1.0:
-        score += 8
+    score = score + np.select(
+        [volume_spike, df['volume_ratio'].to_numpy(dtype=float) > 1.0], [15, 8], default=0)
     
     # Market cap (5-15 points)
-    if 'Mid' in pick['cap_size'] or 'Large' in pick['cap_size']:
-        score += 15
-    elif 'Small' in pick['cap_size']:
-        score += 10
-    else:
-        score += 5
+    score = score + cap_size.map({cap: get_v3_cap_points(cap) for cap in cap_size.unique()}).to_numpy(dtype=int)
     
-    return score
+    return score.astype(int)
 
 
-def calculate_quality_score_v4(pick: Dict) -> float:
+def calculate_quality_score_v4(pick: Dict) -> int:
+    """V4 score for a single pick - see calculate_quality_scores_v4()."""
+    return int(calculate_quality_scores_v4([pick])[0])
+
+
+def calculate_quality_scores_v4(picks: List[Dict]) -> np.ndarray:
     """
     V4 scoring - Updated Jan 7, 2025
     Based on 238-trade validation (67.2% WR)
@@ -274,91 +374,68 @@ def calculate_quality_score_v4(pick: Dict) -> float:
     
     Gap: 16.2 points (p<0.0001)
     V4 ≥120: 85.2% WR | V4 ≥100: ~78% WR
+    
+    Scores every pick in one pass, column-wise over a DataFrame of the picks.
+    This is the only implementation of the V4 rules.
     """
-    score = 0
+    df = pd.DataFrame(picks)
+    
+    def column(name, default):
+        if name not in df:
+            return np.full(len(df), default)
+        return df[name].to_numpy()
+    
+    def flag(name):
+        # Picks missing the key come through as NaN, which is truthy -
+        # score them like pick.get(name) would
+        if name not in df:
+            return np.zeros(len(df), dtype=bool)
+        return df[name].fillna(False).to_numpy().astype(bool)
+    
+    fresh = column('change_7d', np.nan).astype(float)
+    si = column('short_percent', 0).astype(float)
+    cap_size = df['cap_size']
+    inst = column('inst_ownership', 100).astype(float)
+    regime = column('regime', 'Risk-On')
     
     # 1. FRESH % (0-50 points)
-    fresh = pick['change_7d']
-    if 1.0 <= fresh <= 2.0:
-        score += 50  # 80.4% WR (41-10 on 51 trades)
-    elif 4.0 <= fresh <= 5.0:
-        score += 45  # 87.5% WR (14-2 on 16 trades)
-    elif 0 <= fresh < 1.0:
-        score += 40  # 71.2% WR (47-19 on 66 trades)
-    elif -2.0 <= fresh < 0:
-        score += 20  # 59.5% WR (25-17 on 42 trades)
-    elif 3.0 < fresh < 4.0:
-        score += 5   # 38.1% WR (8-13 on 21 trades) - TOXIC!
-    elif fresh > 5.0:
-        score += 10
-    else:  # fresh < -2.0
-        score += 10
+    score = V4_FRESH_POINTS[np.searchsorted(V4_FRESH_EDGES, fresh, side='right')]
     
     # 2. SHORT INTEREST (0-40 points)
-    si = pick.get('short_percent', 0)
-    if 3.0 <= si <= 7.0:
-        score += 40  # 71.9-73.3% WR
-    elif 0 <= si < 1.0:
-        score += 15  # 78.9% WR (30-8 on 38 trades)
-    elif 7.0 < si < 10.0:
-        score += 30  # 72.0% WR
-    elif 2.0 <= si < 3.0:
-        score += 25  # 60.7% WR
-    elif 1.0 <= si < 2.0:
-        score += 15  # 61.1% WR
-    elif 10.0 <= si < 15.0:
-        score += 10  # 51.7% WR
-    # SI ≥15% gets 0
+    score = score + V4_SI_POINTS[np.searchsorted(V4_SI_EDGES, si, side='right')]
     
     # 3. MARKET CAP (0-35 points)
-    cap_size = pick['cap_size']
-    if 'LARGE' in cap_size.upper():
-        score += 35  # 77.1% WR (64-19 on 83 trades)
-    elif 'MID' in cap_size.upper():
-        score += 25  # 67.3% WR (70-34 on 104 trades)
-    elif 'MEGA' in cap_size.upper():
-        score += 15  # 66.7% WR (8-4 on 12 trades)
-    # SMALL gets 0 - 46.2% WR (18-21) LOSES MONEY!
+    score = score + cap_size.map(V4_CAP_POINTS).fillna(0).to_numpy(dtype=int)
     
     # 4. SECTOR PERFORMANCE (0-25 points)
-    sector = pick['sector']
-    if sector == 'Basic Materials':
-        score += 25  # 81.5% WR (22-5 on 27 trades)
-    elif sector == 'Communication Services':
-        score += 20  # 76.0% WR (19-6 on 25 trades)
-    elif sector == 'Healthcare':
-        score += 5  # 65.0% WR (26-14)
-    # Other sectors get 0
-    
-    # 5. COMBINATION BONUSES (0-10 points)
-    if 1.0 <= fresh <= 3.0 and 2.0 <= si <= 5.0:
-        score += 10  # Strong validated combo
-    elif 1.0 <= fresh <= 3.0 and 5.0 <= si <= 10.0:
-        score += 8
+    score = score + df['sector'].map(V4_SECTOR_POINTS).fillna(0).to_numpy(dtype=int)
+    
+    # 5. COMBINATION BONUSES (0-10 points) - 10 is the strong validated combo
+    combo_fresh = (fresh >= 1.0) & (fresh <= 3.0)
+    score = score + np.select(
+        [combo_fresh & (si >= 2.0) & (si <= 5.0), combo_fresh & (si >= 5.0) & (si <= 10.0)],
+        [10, 8], default=0)
     
     # 6. VOLUME SPIKE (0-15 points)
-    if pick.get('volume_spike'):
-        score += 15
-    elif pick['volume_ratio'] > 1.0:
-        score += 8
+    score = score + np.select(
+        [flag('volume_spike'), df['volume_ratio'].to_numpy(dtype=float) > 1.0],
+        [15, 8], default=0)
     
-    # 7. EARNINGS PROXIMITY (0-15 points)
-    if pick.get('earnings_sweet_spot', False):
-        score += 15  # 88.9% WR for 30-60d window
+    # 7. EARNINGS PROXIMITY (0-15 points) - 88.9% WR for 30-60d window
+    score = score + 15 * flag('earnings_sweet_spot')
     
     # 8. INSTITUTIONAL OWNERSHIP (regime-conditional)
-    inst = pick.get('inst_ownership', 100)
-    regime = pick.get('regime', 'Risk-On')
-
-    if inst < 30:
-        if 'LARGE' in cap_size.upper() or 'MID' in cap_size.upper():
-            score += 10  # 84-89% WR
-        elif regime == 'Risk-On' and inst > 90:
-            score -= 20  # Penalty for high inst in Risk-On (if passed filter via RelFresh >2%)
+    # Inst <30% + Large/Mid: +10 (84-89% WR)
+    # Risk-On + Inst >90%: -20 penalty (if passed filter via RelFresh >2%)
     # Risk-Off + High Inst: no penalty (76.9% WR!)
     # Inst 30-90%: neutral (0 points)
+    low_inst = inst < 30
+    score = score + np.select(
+        [low_inst & cap_size.isin(V4_INST_BOOST_CAPS).to_numpy(),
+         low_inst & (regime == 'Risk-On') & (inst > 90)],
+        [10, -20], default=0)
     
-    return score
+    return score.astype(int)
 
 
 # ============ UNIVERSE & SIGNAL FUNCTIONS ============
@@ -387,7 +464,7 @@ def get_universe() -> List[str]:
         
         for ticker in all_tickers:
             try:
-                info = yf.Ticker(ticker).info
+                info = get_ticker_info(ticker)
                 sector = info.get('sector', 'Unknown')
                 
                 if sector in BANNED_SECTORS:
@@ -410,16 +487,15 @@ def get_universe() -> List[str]:
         return ['BIIB', 'AMGN', 'PLTR', 'NVDA', 'SOFI', 'COIN']
 
 
-def check_fresh(ticker: str) -> Dict:
+def check_fresh(hist: Dict[str, np.ndarray]) -> Dict:
     """Check if Fresh."""
     try:
-        hist = yf.Ticker(ticker).history(period="6mo")
-        if len(hist) < 10:
+        close = hist['close']
+        if len(close) < 10:
             return None
         
-        close = hist['Close']
-        change_7d = ((close.iloc[-1] - close.iloc[-8]) / close.iloc[-8] * 100) if len(close) > 7 else 0
-        change_90d = ((close.iloc[-1] - close.iloc[-91]) / close.iloc[-91] * 100) if len(close) > 90 else 0
+        change_7d = ((close[-1] - close[-8]) / close[-8] * 100) if len(close) > 7 else 0
+        change_90d = ((close[-1] - close[-91]) / close[-91] * 100) if len(close) > 90 else 0
         
         is_fresh = FRESH_MIN <= change_7d <= FRESH_MAX and change_90d > -40.0
         
@@ -427,42 +503,88 @@ def check_fresh(ticker: str) -> Dict:
             'change_7d': round(change_7d, 2),
             'change_90d': round(change_90d, 2),
             'is_fresh': is_fresh,
-            'price': float(close.iloc[-1])
+            'price': float(close[-1])
         }
     except:
         return None
 
 
-def check_reddit_confirmation(ticker: str) -> int:
-    """Get Reddit mentions - STRICT MODE."""
-    try:
-        reddit = praw.Reddit(
+_REDDIT = None
+_REDDIT_POSTS = None
+
+
+def get_reddit_client():
+    """Create the PRAW client once and reuse it for the whole run."""
+    global _REDDIT
+    if _REDDIT is None:
+        _REDDIT = praw.Reddit(
             client_id=REDDIT_CLIENT_ID,
             client_secret=REDDIT_CLIENT_SECRET,
             user_agent=REDDIT_USER_AGENT
         )
-        
-        count = 0
+    return _REDDIT
+
+
+def fetch_reddit_posts() -> List[str]:
+    """
+    Fetch the last 24h of new posts once per run (uppercased title + body).
+    The feeds are the same for every ticker, so scan() reuses this list.
+    """
+    global _REDDIT_POSTS
+    if _REDDIT_POSTS is not None:
+        return _REDDIT_POSTS
+
+    posts = []
+    try:
+        reddit = get_reddit_client()
         cutoff_time = datetime.utcnow() - timedelta(hours=24)
-        for sub_name in ['wallstreetbets', 'stocks', 'options']:
+        for sub_name in REDDIT_SUBREDDITS:
             try:
                 subreddit = reddit.subreddit(sub_name)
                 for post in subreddit.new(limit=30):
                     post_time = datetime.utcfromtimestamp(post.created_utc)
                     if post_time < cutoff_time:
                         continue
-                    
-                    text = f"{post.title} {post.selftext}"
-                    text_upper = text.upper()
-                    
-                    if f"${ticker}" in text_upper:
-                        count += 1
+
+                    posts.append(f"{post.title} {post.selftext}".upper())
             except:
                 continue
-        
-        return count
     except:
-        return 0
+        pass
+
+    _REDDIT_POSTS = posts
+    return posts
+
+
+def count_reddit_mentions(posts: List[str], tickers: List[str]) -> Dict[str, int]:
+    """
+    Count posts mentioning each $TICKER in a single pass over the posts.
+    Each '$' in a post is matched against the whole universe at once instead
+    of scanning every post once per ticker.
+    """
+    wanted = set(tickers)
+    counts = dict.fromkeys(wanted, 0)
+    max_len = max((len(t) for t in wanted), default=0)
+
+    for text in posts:
+        found = set()
+        pos = text.find('$')
+        while pos != -1:
+            tail = text[pos + 1:pos + 1 + max_len]
+            for end in range(1, len(tail) + 1):
+                if tail[:end] in wanted:
+                    found.add(tail[:end])
+            pos = text.find('$', pos + 1)
+
+        for ticker in found:
+            counts[ticker] += 1
+
+    return counts
+
+
+def check_reddit_confirmation(ticker: str) -> int:
+    """Get Reddit mentions - STRICT MODE."""
+    return count_reddit_mentions(fetch_reddit_posts(), [ticker])[ticker]
 
 
 def check_accelerating(ticker: str, reddit_mentions: int) -> Dict:
@@ -472,7 +594,7 @@ def check_accelerating(ticker: str, reddit_mentions: int) -> Dict:
         params = {"query": f"${ticker}", "queryType": "Latest"}
         headers = {"X-API-Key": TWITTER_API_KEY}
         
-        response = requests.get(url, params=params, headers=headers, timeout=15)
+        response = _SESSION.get(url, params=params, headers=headers, timeout=15)
         if response.status_code != 200:
             return {'is_accelerating': False, 'buzz_level': 'None', 'recent_mentions': 0}
         
@@ -499,10 +621,26 @@ def check_accelerating(ticker: str, reddit_mentions: int) -> Dict:
         return {'is_accelerating': False, 'buzz_level': 'None', 'recent_mentions': 0}
 
 
+def check_accelerating_batch(reddit_mentions: Dict[str, int]) -> Dict[str, Dict]:
+    """
+    Run check_accelerating() for many tickers concurrently.
+    Takes {ticker: reddit_mentions} and returns {ticker: accel_data}.
+    """
+    if not reddit_mentions:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=TWITTER_MAX_WORKERS) as executor:
+        futures = {
+            ticker: executor.submit(check_accelerating, ticker, mentions)
+            for ticker, mentions in reddit_mentions.items()
+        }
+        return {ticker: future.result() for ticker, future in futures.items()}
+
+
 def check_squeeze(ticker: str) -> Dict:
     """Check short interest."""
     try:
-        info = yf.Ticker(ticker).info
+        info = get_ticker_info(ticker)
         short_percent = info.get('shortPercentOfFloat', 0) * 100
         has_squeeze = short_percent > MAX_SHORT_PERCENT
         
@@ -515,9 +653,9 @@ def check_squeeze(ticker: str) -> Dict:
 
 
 def get_quality_data(ticker: str) -> Dict:
-    """Get stock data with all metrics."""
+    """Get basic stock data (cap, sector, price, volume) from the cached info."""
     try:
-        info = yf.Ticker(ticker).info
+        info = get_ticker_info(ticker)
         
         sector = info.get('sector', 'Unknown')
         if sector in BANNED_SECTORS:
@@ -530,7 +668,7 @@ def get_quality_data(ticker: str) -> Dict:
         inst_pct = info.get('heldPercentInstitutions')
         inst_ownership = inst_pct * 100 if inst_pct is not None else 100
         
-        if market_cap < 2_000_000_000:
+        if market_cap < SMALL_CAP_MAX:
             cap_size = "Small (<$2B)"
         elif market_cap < 10_000_000_000:
             cap_size = "Mid ($2-10B)"
@@ -542,12 +680,6 @@ def get_quality_data(ticker: str) -> Dict:
         volume_ratio = volume / avg_volume if avg_volume > 0 else 0
         volume_spike = volume_ratio > 1.5
         
-        bb_position = calculate_bollinger_position(ticker)
-        atr_pct = calculate_atr_normalized(ticker)
-        vol_trend = calculate_volume_trend(ticker)
-        rsi = get_rsi(ticker)
-        positioning = calculate_52w_positioning(ticker)
-        
         return {
             'market_cap': market_cap,
             'cap_size': cap_size,
@@ -557,23 +689,96 @@ def get_quality_data(ticker: str) -> Dict:
             'volume_ratio': round(volume_ratio, 2),
             'volume_spike': volume_spike,
             'price': price,
-            'bb_position': bb_position,
-            'atr_pct': atr_pct,
-            'volume_trend': vol_trend,
-            'rsi': rsi,
-            'dist_52w_high': positioning['dist_52w_high'],
-            'dist_52w_low': positioning['dist_52w_low'],
             'inst_ownership': inst_ownership,
         }
     except:
         return None
 
 
+def compute_all_metrics(hist: Dict[str, np.ndarray]) -> Dict:
+    """
+    Fresh check plus every technical metric (BB, ATR, vol trend, RSI, 52w)
+    from a single 1y fetch_ohlcv() panel. Returns None if there isn't
+    enough history for the Fresh check.
+    """
+    fresh_data = check_fresh(hist)
+    if not fresh_data:
+        return None
+    
+    positioning = calculate_52w_positioning(hist)
+    
+    return {
+        **fresh_data,
+        'bb_position': calculate_bollinger_position(hist),
+        'atr_pct': calculate_atr_normalized(hist),
+        'volume_trend': calculate_volume_trend(hist),
+        'rsi': get_rsi(hist),
+        'dist_52w_high': positioning['dist_52w_high'],
+        'dist_52w_low': positioning['dist_52w_low'],
+    }
+
+
+def get_market_regime() -> Dict:
+    """
+    SPY regime (Risk-On when close > 20-day SMA) and SPY 7d % change.
+    Defaults to Risk-On if SPY data is unavailable; spy_7d is then None.
+    """
+    try:
+        close = fetch_ohlcv('SPY', "2mo")['close']
+        
+        if len(close) >= 20:
+            sma_20 = close[-20:].mean()
+            regime = 'Risk-On' if close[-1] > sma_20 else 'Risk-Off'
+        else:
+            regime = 'Risk-On'
+        
+        spy_7d = ((close[-1] / close[-8]) - 1) * 100 if len(close) >= 8 else None
+        
+        if spy_7d is None:
+            print(f"⚠️  Only {len(close)} SPY bars - Relative Fresh filter OFF this scan")
+        
+        return {'regime': regime, 'spy_7d': spy_7d}
+    except Exception as e:
+        print(f"⚠️  SPY fetch failed ({e}) - defaulting to Risk-On, Relative Fresh filter OFF this scan")
+        return {'regime': 'Risk-On', 'spy_7d': None}
+
+
+# ============ STATE FILES ============
+
+_STATE_CACHE = {}
+
+
+def load_state_file(path: str) -> Dict:
+    """
+    Load a JSON state file (positions / recent picks) once per run.
+    Later calls reuse the parsed dict; raises if the file is missing.
+    """
+    if path not in _STATE_CACHE:
+        if orjson:
+            with open(path, 'rb') as f:
+                _STATE_CACHE[path] = orjson.loads(f.read())
+        else:
+            with open(path, 'r') as f:
+                _STATE_CACHE[path] = json.load(f)
+    return _STATE_CACHE[path]
+
+
+def save_state_file(path: str, data: Dict):
+    """Write a JSON state file through and keep the cached copy in sync."""
+    if orjson:
+        # Same layout as json.dump(indent=2), so the committed files don't churn
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+    _STATE_CACHE[path] = data
+
+
 def save_entry_dates(orders):
     """Save entry dates for 7-day tracking."""
     try:
-        with open(POSITIONS_FILE, 'r') as f:
-            data = json.load(f)
+        data = load_state_file(POSITIONS_FILE)
     except:
         data = {}
     
@@ -586,8 +791,7 @@ def save_entry_dates(orders):
             'entry_price': order['entry_price']
         }
     
-    with open(POSITIONS_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    save_state_file(POSITIONS_FILE, data)
     
     print(f"💾 Saved entry dates for {len(orders)} positions")
 
@@ -601,8 +805,7 @@ def sell_seven_day_positions():
     
     try:
         try:
-            with open(POSITIONS_FILE, 'r') as f:
-                tracked_positions = json.load(f)
+            tracked_positions = load_state_file(POSITIONS_FILE)
         except:
             print("📝 No tracked positions yet")
             return []
@@ -658,8 +861,7 @@ def sell_seven_day_positions():
             else:
                 print(f"  📅 {ticker}: Day {days_held}/7 (hold)")
         
-        with open(POSITIONS_FILE, 'w') as f:
-            json.dump(tracked_positions, f, indent=2)
+        save_state_file(POSITIONS_FILE, tracked_positions)
         
         if sells:
             total_profit = sum(s['profit'] for s in sells)
@@ -767,48 +969,58 @@ def scan() -> Tuple[List[Dict], List[Dict]]:
 
     # Track recent picks with 7-day cooldown (prevents same stock within 7 days)
     COOLDOWN_DAYS = 7
-    recent_picks_file = "recent_picks.json"
     
     try:
-        with open(recent_picks_file, 'r') as f:
-            recent_picks_data = json.load(f)
-            # Convert to dict of {ticker: date_object}
-            recent_picks = {}
-            for ticker, date_str in recent_picks_data.items():
-                try:
-                    recent_picks[ticker] = datetime.strptime(date_str, '%Y-%m-%d').date()
-                except:
-                    pass  # Skip malformed dates
-            
-            print(f"📅 Loaded {len(recent_picks)} recent picks with 7-day cooldown tracking")
+        recent_picks_data = load_state_file(RECENT_PICKS_FILE)
+        # Convert to dict of {ticker: date_object}
+        recent_picks = {}
+        for ticker, date_str in recent_picks_data.items():
+            try:
+                recent_picks[ticker] = datetime.strptime(date_str, '%Y-%m-%d').date()
+            except:
+                pass  # Skip malformed dates
+        
+        print(f"📅 Loaded {len(recent_picks)} recent picks with 7-day cooldown tracking")
     except:
         recent_picks = {}
         print(f"📅 First run - No recent picks file found")
     
+    # Reddit feeds are identical for every ticker - pull them once
+    reddit_posts = fetch_reddit_posts()
+    reddit_counts = count_reddit_mentions(reddit_posts, universe)
+    print(f"🤖 Loaded {len(reddit_posts)} Reddit posts from the last 24h")
+    
     print(f"\n🔍 Scanning {len(universe)} stocks...\n")
     
+    # SPY regime + 7d change are the same for every ticker - compute once
+    market = get_market_regime()
+    calculated_regime = market['regime']
+    spy_7d = market['spy_7d']
+    print(f"📈 Market regime: {calculated_regime}")
+    
     # Debug counters
     earnings_filtered = 0
     
+    # Pass 1: every filter that doesn't need Twitter
+    candidates = []
     for ticker in universe:
         try:
+            # Cheapest checks first - no network needed
+            if len(ticker) == 1:
+                continue
+            
+            # Check 7-day cooldown
+            if ticker in recent_picks:
+                days_since = (datetime.now().date() - recent_picks[ticker]).days
+                if days_since < COOLDOWN_DAYS:
+                    print(f"   ⏸️  {ticker} picked {days_since}d ago - COOLDOWN (need 7d)")
+                    continue
+            
             # Get basic quality data
             quality = get_quality_data(ticker)
-            if not quality or len(ticker) == 1:
+            if not quality:
                 continue
             
-            # CALCULATE REGIME EARLY (before any filters)
-            try:
-                spy_hist = yf.Ticker('SPY').history(period="2mo")
-                if len(spy_hist) >= 20:
-                    sma_20 = spy_hist['Close'].rolling(20).mean().iloc[-1]
-                    current_spy = spy_hist['Close'].iloc[-1]
-                    calculated_regime = 'Risk-On' if current_spy > sma_20 else 'Risk-Off'
-                else:
-                    calculated_regime = 'Risk-On'
-            except:
-                calculated_regime = 'Risk-On'  # Default to Risk-On if calc fails
-            
             # Basic filters
             if quality['market_cap'] < MIN_MARKET_CAP:
                 continue
@@ -817,45 +1029,19 @@ def scan() -> Tuple[List[Dict], List[Dict]]:
             if quality['price'] * quality['volume'] < MIN_VOLUME_USD:
                 continue
             
-            # Now check Fresh (need this for RelFresh calculation)
-            fresh_data = check_fresh(ticker)
-            if not fresh_data or not fresh_data['is_fresh']:
-                continue
-            
-            # Calculate Relative Fresh (reuse SPY data from above)
-            try:
-                if len(spy_hist) >= 8:
-                    spy_7d = ((spy_hist['Close'].iloc[-1] / spy_hist['Close'].iloc[-8]) - 1) * 100
-                    stock_fresh = fresh_data['change_7d']
-                    calculated_relative_fresh = stock_fresh - spy_7d
-                    
-                    # Relative Fresh >1% filter
-                    if calculated_relative_fresh <= 0.5:
-                        print(f"  ⏭️  {ticker}: Relative Fresh {calculated_relative_fresh:+.1f}%")
-                        continue
-            except:
-                calculated_relative_fresh = 0.0
             if calculated_regime == 'Risk-On' and quality['inst_ownership'] > 90:
                 print(f"  ⏭️  {ticker}: Risk-On + Inst>90% (57% WR)")
                 continue
-            # ... rest of filters ...
-
-            reddit_mentions = check_reddit_confirmation(ticker)
-            accel_data = check_accelerating(ticker, reddit_mentions)
-            if not accel_data['is_accelerating']:
+            
+            # SMALL-CAP HARD SKIP (39% WR, loses money) - same cutoff
+            # that labels cap_size, so no string scan needed
+            if quality['market_cap'] < SMALL_CAP_MAX:
+                print(f"  ⏭️  {ticker}: Small-cap (hard filter - 39% WR)")
                 continue
             
             squeeze_data = check_squeeze(ticker)
             if squeeze_data['has_squeeze']:
                 continue
-
-            # SMALL-CAP HARD SKIP (39% WR, loses money)
-            if 'SMALL' in quality['cap_size'].upper():
-                print(f"  ⏭️  {ticker}: Small-cap (hard filter - 39% WR)")
-                continue
-            if quality['inst_ownership'] > 90 and calculated_relative_fresh >= 2.0:
-                print(f"  ⏭️  {ticker}: Inst>90% + HighRF≥2% (chasing - 51% WR)")
-                continue
             
             # Check earnings proximity
             earnings_data = check_earnings_proximity(ticker, datetime.now())
@@ -866,21 +1052,79 @@ def scan() -> Tuple[List[Dict], List[Dict]]:
                 print(f"  ⏭️  Skipping {ticker} (earnings passed <30d ago - weak period)")
                 continue
             
-            # Check 7-day cooldown
-            if ticker in recent_picks:
-                days_since = (datetime.now().date() - recent_picks[ticker]).days
-                if days_since < COOLDOWN_DAYS:
-                    print(f"   ⏸️  {ticker} picked {days_since}d ago - COOLDOWN (need 7d)")
+            # Only Fresh, Relative Fresh and the Inst>90% + RF check need
+            # price history - one 1y download covers them and every metric
+            try:
+                hist = fetch_ohlcv(ticker, "1y")
+            except Exception as e:
+                print(f"  ⚠️  {ticker}: price history fetch failed - {e}")
+                continue
+            metrics = compute_all_metrics(hist)
+            
+            # Now check Fresh (need this for RelFresh calculation)
+            if not metrics or not metrics['is_fresh']:
+                continue
+            
+            # Calculate Relative Fresh (SPY 7d computed once before the loop)
+            if spy_7d is not None:
+                calculated_relative_fresh = metrics['change_7d'] - spy_7d
+                
+                # Relative Fresh >1% filter
+                if calculated_relative_fresh <= 0.5:
+                    print(f"  ⏭️  {ticker}: Relative Fresh {calculated_relative_fresh:+.1f}%")
                     continue
+            else:
+                calculated_relative_fresh = 0.0
+            
+            if quality['inst_ownership'] > 90 and calculated_relative_fresh >= 2.0:
+                print(f"  ⏭️  {ticker}: Inst>90% + HighRF≥2% (chasing - 51% WR)")
+                continue
+            
+            candidates.append({
+                'ticker': ticker,
+                'quality': quality,
+                'metrics': metrics,
+                'relative_fresh': calculated_relative_fresh,
+                'squeeze_data': squeeze_data,
+                'earnings_data': earnings_data,
+            })
+        
+        except:
+            continue
+    
+    # Twitter buzz is the only per-ticker HTTP call left - run it concurrently
+    # for everything that survived the filters above
+    print(f"\n🐦 Checking Twitter buzz for {len(candidates)} candidates...")
+    accel_results = check_accelerating_batch(
+        {c['ticker']: reddit_counts.get(c['ticker'], 0) for c in candidates}
+    )
+    
+    # Entry stamp is the same for every pick in this scan
+    now = datetime.now()
+    entry_date, entry_time, entry_day = now.strftime('%Y-%m-%d'), now.strftime('%I:%M %p'), now.strftime('%A')
+    
+    for candidate in candidates:
+        try:
+            ticker = candidate['ticker']
+            quality = candidate['quality']
+            metrics = candidate['metrics']
+            squeeze_data = candidate['squeeze_data']
+            earnings_data = candidate['earnings_data']
+            calculated_relative_fresh = candidate['relative_fresh']
+            reddit_mentions = reddit_counts.get(ticker, 0)
+            
+            accel_data = accel_results[ticker]
+            if not accel_data['is_accelerating']:
+                continue
             
             pick = {
                 'ticker': ticker,
-                'entry_date': datetime.now().strftime('%Y-%m-%d'),
-                'entry_time': datetime.now().strftime('%I:%M %p'),
-                'entry_day': datetime.now().strftime('%A'),
-                'price': fresh_data['price'],
-                'change_7d': fresh_data['change_7d'],
-                'change_90d': fresh_data['change_90d'],
+                'entry_date': entry_date,
+                'entry_time': entry_time,
+                'entry_day': entry_day,
+                'price': metrics['price'],
+                'change_7d': metrics['change_7d'],
+                'change_90d': metrics['change_90d'],
                 'market_cap': quality['market_cap'],
                 'cap_size': quality['cap_size'],
                 'sector': quality['sector'],
@@ -893,12 +1137,12 @@ def scan() -> Tuple[List[Dict], List[Dict]]:
                 'is_fresh': True,
                 'is_accelerating': True,
                 'has_squeeze': False,
-                'bb_position': quality['bb_position'],
-                'atr_pct': quality['atr_pct'],
-                'volume_trend': quality['volume_trend'],
-                'rsi': quality['rsi'],
-                'dist_52w_high': quality['dist_52w_high'],
-                'dist_52w_low': quality['dist_52w_low'],
+                'bb_position': metrics['bb_position'],
+                'atr_pct': metrics['atr_pct'],
+                'volume_trend': metrics['volume_trend'],
+                'rsi': metrics['rsi'],
+                'dist_52w_high': metrics['dist_52w_high'],
+                'dist_52w_low': metrics['dist_52w_low'],
                 'inst_ownership': quality['inst_ownership'],
                 'earnings_sweet_spot': earnings_data['earnings_sweet_spot'],
                 'days_to_earnings': earnings_data['days_to_earnings'],
@@ -907,10 +1151,6 @@ def scan() -> Tuple[List[Dict], List[Dict]]:
                 'group': 'V4',
             }
             
-            # Calculate both scores
-            pick['quality_score'] = calculate_quality_score(pick)  # V3 (legacy tracking)
-            pick['v4_score'] = calculate_quality_score_v4(pick)    # V4 (active selection)
-            
             picks.append(pick)
         
         except:
@@ -921,22 +1161,41 @@ def scan() -> Tuple[List[Dict], List[Dict]]:
     print(f"   Total Fresh+Accel: {len(picks)}")
     print(f"   Filtered by earnings: {earnings_filtered}")
     
+    # Score all picks in one vectorized pass each
+    if picks:
+        v3_scores = calculate_quality_scores(picks).tolist()    # V3 (legacy tracking)
+        v4_scores = calculate_quality_scores_v4(picks).tolist()  # V4 (active selection)
+        for pick, v3_score, v4_score in zip(picks, v3_scores, v4_scores):
+            pick['quality_score'] = v3_score
+            pick['v4_score'] = v4_score
+    
     # V4 SELECTION (Deployed Dec 30, 2025)
-    picks.sort(key=lambda x: x['v4_score'], reverse=True)
+    v4_key = lambda x: x['v4_score']
     
     # Show V4 score distribution
     if picks:
-        v4_scores = [p['v4_score'] for p in picks]
-        print(f"   V4 score range: {min(v4_scores):.0f} - {max(v4_scores):.0f}")
-        print(f"   V4 ≥100: {len([p for p in picks if p['v4_score'] >= 100])}")
-        print(f"   V4 90-100: {len([p for p in picks if 90 <= p['v4_score'] < 100])}")
-        print(f"   V4 <90: {len([p for p in picks if p['v4_score'] < 90])}")
+        # Range and buckets in one pass
+        v4_high = v4_mid = 0
+        v4_lo = v4_hi = picks[0]['v4_score']
+        for p in picks:
+            v4_lo = min(v4_lo, p['v4_score'])
+            v4_hi = max(v4_hi, p['v4_score'])
+            if p['v4_score'] >= 100:
+                v4_high += 1
+            elif p['v4_score'] >= 90:
+                v4_mid += 1
+        print(f"   V4 score range: {v4_lo:.0f} - {v4_hi:.0f}")
+        print(f"   V4 ≥100: {v4_high}")
+        print(f"   V4 90-100: {v4_mid}")
+        print(f"   V4 <90: {len(picks) - v4_high - v4_mid}")
     
-    # Apply V4 ≥100 quality filter
+    # Apply V4 ≥100 quality filter - only the top few are ever used, so pull
+    # them with nlargest (same order as a stable descending sort) instead of
+    # sorting everything
     quality_picks = [p for p in picks if p['v4_score'] >= 100]
 
     if len(quality_picks) >= 3:
-        top_picks = quality_picks[:10]
+        top_picks = heapq.nlargest(10, quality_picks, key=v4_key)
         v4_min = min(p['v4_score'] for p in top_picks)
         v4_max = max(p['v4_score'] for p in top_picks)
         print(f"\n✅ Using {len(top_picks)} quality picks (V4 ≥100)")
@@ -944,32 +1203,32 @@ def scan() -> Tuple[List[Dict], List[Dict]]:
     else:
         # NEVER SIT OUT - take top 3 by score regardless
         if len(picks) >= 3:
-            top_picks = sorted(picks, key=lambda x: x['v4_score'], reverse=True)[:3]
+            top_picks = heapq.nlargest(3, picks, key=v4_key)
             v4_min = min(p['v4_score'] for p in top_picks)
             v4_max = max(p['v4_score'] for p in top_picks)
             print(f"\n⚠️ Only {len(quality_picks)} V4≥100 picks - TAKING TOP 3 ANYWAY")
             print(f"   V4 Score range: {v4_min:.0f}-{v4_max:.0f}")
             print(f"   Edge lives in relative ranking - never sit out\n")
         elif len(picks) > 0:
-            top_picks = picks  # Take whatever we have
+            top_picks = sorted(picks, key=v4_key, reverse=True)  # Take whatever we have
             print(f"\n⚠️ Taking all {len(picks)} available picks\n")
         else:
             top_picks = []
             print(f"\n❌ Zero stocks passed filters - genuine sit out\n")
     
     # Update cooldown tracker with all selected picks
+    today = datetime.now().date()
+    today_str = today.strftime('%Y-%m-%d')
     for pick in top_picks:
-        recent_picks[pick['ticker']] = datetime.now().strftime('%Y-%m-%d')
+        recent_picks[pick['ticker']] = today_str
     
-    # Clean old picks (>30 days to avoid file bloat)
-    today = datetime.now().date()
+    # Clean old picks (>30 days to avoid file bloat) - ISO dates compare as strings
+    cutoff_str = (today - timedelta(days=30)).strftime('%Y-%m-%d')
     recent_picks = {ticker: date_str for ticker, date_str in recent_picks.items()
-                   if isinstance(date_str, str) and 
-                   (today - datetime.strptime(date_str, '%Y-%m-%d').date()).days < 30}
+                   if isinstance(date_str, str) and date_str > cutoff_str}
     
     # Save recent picks with dates
-    with open(recent_picks_file, 'w') as f:
-        json.dump(recent_picks, f, indent=2)
+    save_state_file(RECENT_PICKS_FILE, recent_picks)
     
     return top_picks, []
 
@@ -978,15 +1237,17 @@ def save_picks(all_picks: List[Dict]):
     if not all_picks:
         return
     
-    df = pd.DataFrame(all_picks)
     timestamp = datetime.now().strftime("%Y-%m-%d_%H%M")
-    filename = f"outputs/supabot_v3_scan_{timestamp}.csv"
+    filename = f"{OUTPUTS_DIR}/supabot_v3_scan_{timestamp}.csv"
     
-    os.makedirs("outputs", exist_ok=True)
-    df.to_csv(filename, index=False)
+    # A day's picks are a handful of flat dicts - write them directly,
+    # no DataFrame needed
+    with open(filename, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(all_picks[0].keys()), lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(all_picks)
     
     print(f"✅ Saved {len(all_picks)} picks to {filename}")
-    return df
 
 
 def display_picks(picks: List[Dict]):
@@ -995,23 +1256,25 @@ def display_picks(picks: List[Dict]):
         print("\n❌ No quality picks today (sitting out)")
         return
     
-    print(f"\n{'='*80}")
-    print(f"🎯 TOP {len(picks)} PICKS (V4 SELECTION - Quality Filter ≥100)")
-    print(f"{'='*80}\n")
+    # Build the whole report, then write it once
+    lines = [
+        f"\n{'='*80}",
+        f"🎯 TOP {len(picks)} PICKS (V4 SELECTION - Quality Filter ≥100)",
+        f"{'='*80}\n",
+    ]
     for i, pick in enumerate(picks, 1):
         volume_flag = "🔊" if pick['volume_spike'] else ""
+        earnings_flag = " 📅" if pick.get('earnings_sweet_spot') else ""
+        inst_flag = " 🏢" if pick.get('inst_ownership', 100) < 30 else ""
+        
+        lines.append(f"{i}. {pick['ticker']} - ${pick['price']:.2f} (V4 Score: {pick['v4_score']:.0f})")
+        lines.append(f"   {pick['sector']} | Fresh: {pick['change_7d']:+.1f}% | {pick['cap_size']}")
+        lines.append(f"   Buzz: {pick['buzz_level']} ({pick['twitter_mentions']}🐦 {pick['reddit_mentions']}🤖){volume_flag}{earnings_flag}{inst_flag}")
+        lines.append(f"   📊 SI: {pick['short_percent']:.1f}% | 52w: {pick['dist_52w_high']:+.1f}% | Inst: {pick['inst_ownership']:.0f}%")
+        lines.append("")
     
-    earnings_flag = " 📅" if pick.get('earnings_sweet_spot') else ""
-    inst_flag = " 🏢" if pick.get('inst_ownership', 100) < 30 else ""
-        
-    print(f"{i}. {pick['ticker']} - ${pick['price']:.2f} (V4 Score: {pick['v4_score']:.0f})")
-    print(f"   {pick['sector']} | Fresh: {pick['change_7d']:+.1f}% | {pick['cap_size']}")
-    print(f"   Buzz: {pick['buzz_level']} ({pick['twitter_mentions']}🐦 {pick['reddit_mentions']}🤖){volume_flag}{earnings_flag}{inst_flag}")
-    print(f"   📊 SI: {pick['short_percent']:.1f}% | 52w: {pick['dist_52w_high']:+.1f}% | Inst: {pick['inst_ownership']:.0f}%")
-    print()
-        
-    print(f"{'='*80}\n")
-        
+    lines.append(f"{'='*80}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def send_discord_notification(picks: List[Dict]):
@@ -1022,6 +1285,8 @@ def send_discord_notification(picks: List[Dict]):
         print("⚠️  DISCORD_WEBHOOK_V3 not set")
         return
     
+    ts = datetime.now().strftime('%Y-%m-%d %I:%M %p')
+    
     try:
         from discord_webhook import DiscordWebhook, DiscordEmbed
         
@@ -1033,7 +1298,7 @@ def send_discord_notification(picks: List[Dict]):
                 description="No quality picks today (V4 <100) - Sitting out",
                 color='808080'
             )
-            embed.set_footer(text=f"V4 Selection | {datetime.now().strftime('%Y-%m-%d %I:%M %p')}")
+            embed.set_footer(text=f"V4 Selection | {ts}")
             webhook.add_embed(embed)
             webhook.execute()
             return
@@ -1044,7 +1309,14 @@ def send_discord_notification(picks: List[Dict]):
             color='00ff00'
         )
         
+        # Summary sums accumulate alongside the per-pick fields
+        total_v4 = total_52w = total_bb = 0.0
+        
         for i, pick in enumerate(picks, 1):
+            total_v4 += pick['v4_score']
+            total_52w += pick['dist_52w_high']
+            total_bb += pick['bb_position']
+            
             signals = ["✨", "📈"]
             if pick.get('volume_spike'):
                 signals.append("📊")
@@ -1067,9 +1339,9 @@ def send_discord_notification(picks: List[Dict]):
                 inline=False
             )
         
-        avg_v4 = sum(p['v4_score'] for p in picks) / len(picks)
-        avg_52w = sum(p['dist_52w_high'] for p in picks) / len(picks)
-        avg_bb = sum(p['bb_position'] for p in picks) / len(picks)
+        avg_v4 = total_v4 / len(picks)
+        avg_52w = total_52w / len(picks)
+        avg_bb = total_bb / len(picks)
         
         embed.add_embed_field(
             name="📈 Summary",
@@ -1077,7 +1349,7 @@ def send_discord_notification(picks: List[Dict]):
             inline=False
         )
         
-        embed.set_footer(text=f"V4 Selection (≥100) + Earnings + Inst | {datetime.now().strftime('%Y-%m-%d %I:%M %p')}")
+        embed.set_footer(text=f"V4 Selection (≥100) + Earnings + Inst | {ts}")
         webhook.add_embed(embed)
         
         webhook.execute()
@@ -1107,19 +1379,20 @@ if __name__ == "__main__":
     
     display_picks(picks)
     
-    if picks:
-            save_picks(picks)  # Only V4 picks, no control
-    
     print(f"{'='*80}")
-    print("📤 SENDING DISCORD NOTIFICATION...")
+    print("📤 SAVING CSV, SENDING DISCORD & PLACING ALPACA PAPER TRADES ($500/stock)...")
     print(f"{'='*80}")
-    send_discord_notification(picks)
-    print(f"{'='*80}\n")
     
-    print(f"{'='*80}")
-    print("📈 PLACING ALPACA PAPER TRADES ($500/stock)...")
-    print(f"{'='*80}")
-    place_paper_trades(picks)
+    # CSV, Discord and Alpaca only need the picks - overlap their I/O
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(send_discord_notification, picks),
+            executor.submit(place_paper_trades, picks),
+        ]
+        if picks:
+            futures.append(executor.submit(save_picks, picks))  # Only V4 picks, no control
+        for future in futures:
+            future.result()
     print(f"{'='*80}\n")
     
     print(f"\n⏱️  Scan completed in {elapsed:.1f} seconds")